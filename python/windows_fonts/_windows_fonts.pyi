@@ -1,5 +1,6 @@
 from __future__ import annotations
 import enum
+from types import MappingProxyType
 
 class FontCollection:
     def __len__(self) -> int: ...
@@ -10,14 +11,17 @@ class FontFamily:
     def __len__(self) -> int: ...
     def __getitem__(self, idx: int) -> FontVariant: ...
     def get_matching_variants(
-        self, *, weight: float | Weight | None = None, style: Style | None = None
+        self, *, weight: float | Weight | None = None, style: Style | int | None = None
     ) -> list[FontVariant]: ...
-    def get_best_variant(self, *, weight: float | Weight | None = None, style: Style | None = None) -> FontVariant: ...
+    def get_best_variant(
+        self, *, weight: float | Weight | None = None, style: Style | int | None = None
+    ) -> FontVariant: ...
 
 class FontVariant:
     style: Style
     weight: Weight
     filename: str
+    information: MappingProxyType[str, str]
     def files(self) -> list[str]: ...
 
 class Style(enum.Enum):
@@ -1,3 +1,6 @@
+use std::convert::TryFrom;
+
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 use windows::Win32::Graphics::DirectWrite::{
     DWRITE_FONT_STYLE_ITALIC, DWRITE_FONT_STYLE_NORMAL, DWRITE_FONT_STYLE_OBLIQUE,
@@ -39,3 +42,25 @@ pub enum Style {
     ITALIIC = DWRITE_FONT_STYLE_ITALIC.0,
     OBLIQUE = DWRITE_FONT_STYLE_OBLIQUE.0,
 }
+
+impl From<Style> for i32 {
+    fn from(s: Style) -> Self {
+        s as i32
+    }
+}
+
+impl TryFrom<i32> for Style {
+    type Error = PyErr;
+
+    fn try_from(value: i32) -> PyResult<Self> {
+        match value {
+            v if v == Style::NORMAL as i32 => Ok(Style::NORMAL),
+            v if v == Style::OBLIQUE as i32 => Ok(Style::OBLIQUE),
+            v if v == Style::ITALIIC as i32 => Ok(Style::ITALIIC),
+            _ => Err(PyValueError::new_err(format!(
+                "{} is not a valid Style",
+                value
+            ))),
+        }
+    }
+}
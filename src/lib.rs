@@ -1,13 +1,18 @@
-use std::cell::RefCell;
+use std::cell::{Cell, OnceCell, RefCell};
+use std::collections::HashMap;
+use std::convert::TryFrom;
 use std::ffi::{c_int, c_void};
 use std::slice;
+use std::sync::atomic::{AtomicUsize, Ordering};
 
-use anyhow::{bail, Result};
+use anyhow::Result;
 
 use pyo3::class::basic::CompareOp;
-use pyo3::exceptions::{PyIndexError, PyKeyError, PyRuntimeError};
+use pyo3::exceptions::{PyIndexError, PyKeyError, PyRuntimeError, PyTypeError};
+use pyo3::once_cell::GILOnceCell;
 use pyo3::prelude::*;
-use pyo3::types::{PyList, PyString};
+use pyo3::types::{PyBool, PyDict, PyList, PyString};
+use pyo3::AsPyPointer;
 use windows::core::HSTRING;
 use windows::Win32::Foundation::BOOL;
 use windows::{
@@ -16,8 +21,19 @@ use windows::{
     Win32::Graphics::DirectWrite::{
         DWriteCreateFactory, IDWriteFactory1, IDWriteFont, IDWriteFontCollection1,
         IDWriteFontFamily, IDWriteFontFile, IDWriteLocalFontFileLoader, IDWriteLocalizedStrings,
-        DWRITE_FACTORY_TYPE_SHARED, DWRITE_FONT_STRETCH_NORMAL, DWRITE_FONT_STYLE,
-        DWRITE_FONT_WEIGHT,
+        DWRITE_FACTORY_TYPE_SHARED, DWRITE_FONT_SIMULATIONS, DWRITE_FONT_STRETCH,
+        DWRITE_FONT_STRETCH_NORMAL, DWRITE_FONT_STYLE, DWRITE_FONT_WEIGHT,
+        DWRITE_INFORMATIONAL_STRING_COPYRIGHT_NOTICE, DWRITE_INFORMATIONAL_STRING_DESCRIPTION,
+        DWRITE_INFORMATIONAL_STRING_DESIGNER, DWRITE_INFORMATIONAL_STRING_DESIGNER_URL,
+        DWRITE_INFORMATIONAL_STRING_FONT_VENDOR_URL, DWRITE_INFORMATIONAL_STRING_ID,
+        DWRITE_INFORMATIONAL_STRING_LICENSE_DESCRIPTION,
+        DWRITE_INFORMATIONAL_STRING_LICENSE_INFO_URL, DWRITE_INFORMATIONAL_STRING_MANUFACTURER,
+        DWRITE_INFORMATIONAL_STRING_PREFERRED_FAMILY_NAMES,
+        DWRITE_INFORMATIONAL_STRING_PREFERRED_SUBFAMILY_NAMES,
+        DWRITE_INFORMATIONAL_STRING_SAMPLE_TEXT, DWRITE_INFORMATIONAL_STRING_TRADEMARK,
+        DWRITE_INFORMATIONAL_STRING_VERSION_STRINGS,
+        DWRITE_INFORMATIONAL_STRING_WIN32_FAMILY_NAMES,
+        DWRITE_INFORMATIONAL_STRING_WIN32_SUBFAMILY_NAMES,
     },
 };
 
@@ -76,9 +92,19 @@ enum IntOrStr<'a> {
     Int(isize),
 }
 
-#[pyclass(module = "windows_fonts", unsendable)]
+static NEXT_COLLECTION_ID: AtomicUsize = AtomicUsize::new(0);
+
+#[pyclass(frozen, module = "windows_fonts", unsendable)]
 struct FontCollection {
     collection: IDWriteFontCollection1,
+    // The system collection doesn't change under us, so count the families once up front
+    count: u32,
+    // Unique per FontCollection instance, so families can be compared by (id, index)
+    id: usize,
+    // Lower-cased family name (in every locale) -> family index, built on the second lookup by name
+    family_names: OnceCell<HashMap<String, u32>>,
+    // Whether the one lookup answered by `FindFamilyName` has happened yet
+    looked_up_by_name: Cell<bool>,
 }
 
 impl FontCollection {
@@ -95,6 +121,53 @@ impl FontCollection {
             )
         }
     }
+
+    /// Index of the family with the given name (in any locale), if there is one.
+    ///
+    /// Walking every family to build the name index only pays off over repeated lookups, so the
+    /// first lookup on a collection goes straight to `FindFamilyName` and later ones use the index.
+    fn find_family(&self, name: &str) -> windows::core::Result<Option<u32>> {
+        if self.family_names.get().is_none() && !self.looked_up_by_name.replace(true) {
+            return unsafe { self._find_family_name(name) };
+        }
+        Ok(self.family_names()?.get(&name.to_lowercase()).copied())
+    }
+
+    unsafe fn _find_family_name(&self, name: &str) -> windows::core::Result<Option<u32>> {
+        let mut exists = BOOL(0);
+        let mut index = 0;
+        let s: Vec<u16> = name.encode_utf16().collect();
+        self.collection.FindFamilyName(
+            &HSTRING::from_wide(s.as_slice()),
+            &mut index,
+            &mut exists,
+        )?;
+        Ok(if exists.as_bool() { Some(index) } else { None })
+    }
+
+    fn family_names(&self) -> windows::core::Result<&HashMap<String, u32>> {
+        if let Some(names) = self.family_names.get() {
+            return Ok(names);
+        }
+        let names = unsafe { self._build_family_names() }?;
+        Ok(self.family_names.get_or_init(|| names))
+    }
+
+    /// Walk every family once, recording all of its localized names so lookups by name are a hash
+    /// lookup instead of a `FindFamilyName` call each time.
+    unsafe fn _build_family_names(&self) -> windows::core::Result<HashMap<String, u32>> {
+        let mut names = HashMap::with_capacity(self.count as usize);
+        for index in 0..self.count {
+            let localized = self.collection.GetFontFamily(index)?.GetFamilyNames()?;
+            for i in 0..localized.GetCount() {
+                // DirectWrite matches family names case-insensitively, and returns the first match
+                names
+                    .entry(localized.get_string(i)?.to_lowercase())
+                    .or_insert(index);
+            }
+        }
+        Ok(names)
+    }
 }
 
 #[pymethods]
@@ -102,34 +175,40 @@ impl FontCollection {
     #[new]
     fn __new__() -> Result<Self> {
         let collection = Self::get_system_font_collection()?;
-        Ok(FontCollection { collection })
+        let count = unsafe { collection.GetFontFamilyCount() };
+        Ok(FontCollection {
+            collection,
+            count,
+            id: NEXT_COLLECTION_ID.fetch_add(1, Ordering::Relaxed),
+            family_names: OnceCell::new(),
+            looked_up_by_name: Cell::new(false),
+        })
     }
 
     fn __len__(&self) -> usize {
-        unsafe { self.collection.GetFontFamilyCount() as usize }
+        self.count as usize
     }
 
     fn __getitem__(&self, key: IntOrStr) -> PyResult<FontFamily> {
         let index = match key {
-            IntOrStr::Str(str) => unsafe {
-                let mut exists = BOOL(0);
-                let mut i_out = 0;
-                let s: Vec<u16> = str.to_string().encode_utf16().collect();
-                self.collection
-                    .FindFamilyName(&HSTRING::from_wide(s.as_slice()), &mut i_out, &mut exists)
-                    .map_err(WindowsFontError::from)?;
-                if !exists.as_bool() {
-                    return Err(PyKeyError::new_err(format!(
-                        "unknown font family {:?}",
-                        str
-                    )));
+            IntOrStr::Str(str) => {
+                match self
+                    .find_family(str.to_str()?)
+                    .map_err(WindowsFontError::from)?
+                {
+                    Some(index) => index,
+                    None => {
+                        return Err(PyKeyError::new_err(format!(
+                            "unknown font family {:?}",
+                            str
+                        )))
+                    }
                 }
-                i_out
-            },
+            }
             IntOrStr::Int(idx) => idx as u32,
         };
 
-        if index >= unsafe { self.collection.GetFontFamilyCount() } {
+        if index >= self.count {
             return Err(PyIndexError::new_err("list index out of range"));
         }
 
@@ -139,14 +218,29 @@ impl FontCollection {
                 .map_err(WindowsFontError::from)?
         };
 
-        Ok(FontFamily(ifamily))
+        Ok(FontFamily::new(ifamily, self.id, index))
     }
 }
 trait BestLocaleName {
+    unsafe fn get_string(&self, index: u32) -> windows::core::Result<String>;
     unsafe fn get_best_name(&self) -> Result<String>;
 }
 
 impl BestLocaleName for IDWriteLocalizedStrings {
+    unsafe fn get_string(&self, index: u32) -> windows::core::Result<String> {
+        let len = self.GetStringLength(index)? as usize;
+
+        let mut buff = Vec::new();
+        buff.resize(len + 1, 0u16);
+        self.GetString(index, buff.as_mut_slice())?;
+
+        // Lossy so that one font with a malformed name can't break lookups across the collection
+        Ok(String::from_utf16_lossy(slice::from_raw_parts(
+            buff.as_ptr(),
+            len,
+        )))
+    }
+
     unsafe fn get_best_name(&self) -> Result<String> {
         let mut index = 0u32;
 
@@ -167,13 +261,7 @@ impl BestLocaleName for IDWriteLocalizedStrings {
             Ok(())
         })?;
 
-        let len = self.GetStringLength(index)? as usize;
-
-        let mut buff = Vec::new();
-        buff.resize(len + 1, 0u16);
-        self.GetString(index, buff.as_mut_slice())?;
-
-        Ok(String::from_utf16(slice::from_raw_parts(buff.as_ptr(), len)).unwrap())
+        Ok(self.get_string(index)?)
     }
 }
 
@@ -192,14 +280,67 @@ impl From<FloatOrWeight> for f32 {
     }
 }
 
-#[pyclass(sequence, module = "windows_fonts", unsendable)]
+/// A `Style`, or the int value of one
+struct IntOrStyle(enums::Style);
+
+impl<'source> FromPyObject<'source> for IntOrStyle {
+    fn extract(ob: &'source PyAny) -> PyResult<Self> {
+        if let Ok(style) = ob.extract::<enums::Style>() {
+            return Ok(IntOrStyle(style));
+        }
+        // `bool` is an `int` subclass, but `style=True` reads as "italic" when it would mean OBLIQUE
+        if ob.downcast::<PyBool>().is_ok() {
+            return Err(PyTypeError::new_err(
+                "style must be a Style or an int, not bool",
+            ));
+        }
+        Ok(IntOrStyle(enums::Style::try_from(ob.extract::<i32>()?)?))
+    }
+}
+
+impl From<IntOrStyle> for i32 {
+    fn from(e: IntOrStyle) -> Self {
+        e.0.into()
+    }
+}
+
+#[pyclass(sequence, frozen, module = "windows_fonts", unsendable)]
 #[derive(Clone, Debug)]
-struct FontFamily(IDWriteFontFamily);
+struct FontFamily {
+    family: IDWriteFontFamily,
+    collection_id: usize,
+    index: u32,
+    // (weight, style) -> best matching font. We hold the COM font rather than a `FontVariant` so
+    // that we don't create a reference cycle back to this family
+    best_variants: RefCell<HashMap<(i32, i32), IDWriteFont>>,
+    name: OnceCell<Py<PyString>>,
+}
+
+const BEST_VARIANT_CACHE_SIZE: usize = 32;
 
 impl FontFamily {
+    fn new(family: IDWriteFontFamily, collection_id: usize, index: u32) -> Self {
+        FontFamily {
+            family,
+            collection_id,
+            index,
+            best_variants: RefCell::new(HashMap::new()),
+            name: OnceCell::new(),
+        }
+    }
+
+    /// The best name, decoded and interned on first use
+    fn _get_cached_name(&self, py: Python<'_>) -> Result<&Py<PyString>> {
+        if let Some(name) = self.name.get() {
+            return Ok(name);
+        }
+        let name = unsafe { self._get_best_name() }?;
+        Ok(self.name.get_or_init(|| PyString::intern(py, &name).into()))
+    }
+
     /// Get the name from the "best" available locale, or first as a fallback
     unsafe fn _get_best_name(&self) -> Result<String> {
-        let names = self.0.GetFamilyNames()?;
+        let names = self.family.GetFamilyNames()?;
         names.get_best_name()
     }
 
@@ -207,15 +348,15 @@ impl FontFamily {
     unsafe fn _get_dwrite0_matching_variants(
         rc: Py<Self>,
         weight: Option<f32>,
-        style: Option<enums::Style>,
+        style: Option<i32>,
         py: Python<'_>,
     ) -> Box<dyn Iterator<Item = anyhow::Result<FontVariant>> + '_> {
         let copy = rc.clone();
         let self_ = copy.borrow(py);
-        let list = match self_.0.GetMatchingFonts(
+        let list = match self_.family.GetMatchingFonts(
             DWRITE_FONT_WEIGHT(weight.unwrap_or(400.0) as i32),
             DWRITE_FONT_STRETCH_NORMAL,
-            DWRITE_FONT_STYLE(style.unwrap_or(enums::Style::NORMAL) as i32),
+            DWRITE_FONT_STYLE(style.unwrap_or(enums::Style::NORMAL as i32)),
         ) {
             Ok(l) => l,
             Err(e) => {
@@ -229,10 +370,7 @@ impl FontFamily {
         let it = (0..num).map(move |n| -> Result<FontVariant> {
             let font = list.GetFont(n).map_err(WindowsFontError::from)?;
 
-            Ok(FontVariant {
-                font,
-                family: rc.clone(),
-            })
+            Ok(FontVariant::new(font, rc.clone()))
         });
         Box::new(it)
     }
@@ -241,29 +379,29 @@ impl FontFamily {
 #[pymethods]
 impl FontFamily {
     #[getter]
-    pub fn name(&self) -> Result<String> {
-        unsafe { self._get_best_name() }
+    pub fn name(&self, py: Python<'_>) -> Result<Py<PyString>> {
+        Ok(self._get_cached_name(py)?.clone_ref(py))
     }
 
-    pub fn __repr__(&self) -> Result<String> {
-        Ok(format!("<FontFamily name={:?}>", self.name()?,))
+    pub fn __repr__(&self, py: Python<'_>) -> Result<String> {
+        Ok(format!(
+            "<FontFamily name={:?}>",
+            self._get_cached_name(py)?.as_ref(py).to_str()?,
+        ))
     }
 
     pub fn __len__(&self) -> usize {
-        unsafe { self.0.GetFontCount() as usize }
+        unsafe { self.family.GetFontCount() as usize }
     }
 
     pub fn __getitem__(rc: Py<Self>, mut index: i32, py: Python<'_>) -> PyResult<FontVariant> {
         unsafe {
             let self_ = rc.borrow(py);
             if index < 0 {
-                index += self_.0.GetFontCount() as i32;
+                index += self_.family.GetFontCount() as i32;
             }
-            match self_.0.GetFont(index as u32) {
-                Ok(font) => Ok(FontVariant {
-                    font,
-                    family: rc.clone(),
-                }),
+            match self_.family.GetFont(index as u32) {
+                Ok(font) => Ok(FontVariant::new(font, rc.clone())),
                 Err(_) => Err(PyIndexError::new_err(format!(
                     "key {:?} out of range",
                     index
@@ -285,17 +423,42 @@ impl FontFamily {
     fn get_best_variant(
         rc: Py<Self>,
         weight: Option<FloatOrWeight>,
-        style: Option<enums::Style>,
+        style: Option<IntOrStyle>,
         py: Python<'_>,
     ) -> Result<FontVariant> {
-        if let Some(item) = unsafe {
-            FontFamily::_get_dwrite0_matching_variants(rc, weight.map(Into::into), style, py)
-        }
-        .next()
-        {
-            return item;
-        }
-        bail!("No variants found")
+        // Normalize the defaults so that e.g. `weight=None` and `weight=400` share a cache entry
+        let weight: f32 = weight.map_or(400.0, Into::into);
+        let style: i32 = style.map_or(enums::Style::NORMAL as i32, Into::into);
+        let key = (weight as i32, style);
+
+        let cached = rc.borrow(py).best_variants.borrow().get(&key).cloned();
+        let font = match cached {
+            Some(font) => font,
+            None => {
+                let self_ = rc.borrow(py);
+                // Asks DirectWrite for just the winner, rather than building and sorting the
+                // whole list of matches like `get_matching_variants` has to
+                let font = unsafe {
+                    self_
+                        .family
+                        .GetFirstMatchingFont(
+                            DWRITE_FONT_WEIGHT(weight as i32),
+                            DWRITE_FONT_STRETCH_NORMAL,
+                            DWRITE_FONT_STYLE(style),
+                        )
+                        .map_err(WindowsFontError::from)?
+                };
+
+                let mut cache = self_.best_variants.borrow_mut();
+                if cache.len() >= BEST_VARIANT_CACHE_SIZE {
+                    cache.clear();
+                }
+                cache.insert(key, font.clone());
+                font
+            }
+        };
+
+        Ok(FontVariant::new(font, rc))
     }
 
     /// Retrieves a list of fonts in the font family, ranked in order of how well they match the specified axis values.
@@ -303,12 +466,17 @@ impl FontFamily {
     fn get_matching_variants(
         rc: Py<Self>,
         weight: Option<FloatOrWeight>,
-        style: Option<enums::Style>,
+        style: Option<IntOrStyle>,
         py: Python<'_>,
     ) -> Result<&'_ PyList> {
         let mut variants;
         let iter = unsafe {
-            FontFamily::_get_dwrite0_matching_variants(rc, weight.map(Into::into), style, py)
+            FontFamily::_get_dwrite0_matching_variants(
+                rc,
+                weight.map(Into::into),
+                style.map(Into::into),
+                py,
+            )
         };
 
         if let (_, Some(hint)) = iter.size_hint() {
@@ -326,33 +494,98 @@ impl FontFamily {
 
 impl PartialEq for FontFamily {
     fn eq(&self, other: &Self) -> bool {
-        // Best we can do is compare by name. Each time we get the IDWriteFontFamily it will be a different COM Ptr
-        let name;
-        let other_name: String;
-        unsafe {
-            if let Ok(n) = self._get_best_name() {
-                name = n;
-            } else {
-                return false;
-            }
-            if let Ok(n) = other._get_best_name() {
-                other_name = n;
-            } else {
-                return false;
-            }
+        // Within one collection a family is identified by its index, no COM calls needed
+        if self.collection_id == other.collection_id {
+            return self.index == other.index;
         }
-        name == other_name
+        // Otherwise the best we can do is compare by name. Each time we get the IDWriteFontFamily it will be a different COM Ptr.
+        // The cached names are interned, so equal names are the same Python object
+        Python::with_gil(
+            |py| match (self._get_cached_name(py), other._get_cached_name(py)) {
+                (Ok(name), Ok(other_name)) => name.as_ptr() == other_name.as_ptr(),
+                _ => false,
+            },
+        )
     }
 }
 
-#[pyclass(module = "windows_fonts", unsendable)]
+// The informational strings available on every DirectWrite version we support
+const INFORMATIONAL_STRINGS: &[(&str, DWRITE_INFORMATIONAL_STRING_ID)] = &[
+    ("copyright", DWRITE_INFORMATIONAL_STRING_COPYRIGHT_NOTICE),
+    (
+        "version_strings",
+        DWRITE_INFORMATIONAL_STRING_VERSION_STRINGS,
+    ),
+    ("trademark", DWRITE_INFORMATIONAL_STRING_TRADEMARK),
+    ("manufacturer", DWRITE_INFORMATIONAL_STRING_MANUFACTURER),
+    ("designer", DWRITE_INFORMATIONAL_STRING_DESIGNER),
+    ("designer_url", DWRITE_INFORMATIONAL_STRING_DESIGNER_URL),
+    ("description", DWRITE_INFORMATIONAL_STRING_DESCRIPTION),
+    (
+        "font_vendor_url",
+        DWRITE_INFORMATIONAL_STRING_FONT_VENDOR_URL,
+    ),
+    (
+        "license_description",
+        DWRITE_INFORMATIONAL_STRING_LICENSE_DESCRIPTION,
+    ),
+    (
+        "license_info_url",
+        DWRITE_INFORMATIONAL_STRING_LICENSE_INFO_URL,
+    ),
+    (
+        "win32_family_names",
+        DWRITE_INFORMATIONAL_STRING_WIN32_FAMILY_NAMES,
+    ),
+    (
+        "win32_subfamily_names",
+        DWRITE_INFORMATIONAL_STRING_WIN32_SUBFAMILY_NAMES,
+    ),
+    (
+        "preferred_family_names",
+        DWRITE_INFORMATIONAL_STRING_PREFERRED_FAMILY_NAMES,
+    ),
+    (
+        "preferred_subfamily_names",
+        DWRITE_INFORMATIONAL_STRING_PREFERRED_SUBFAMILY_NAMES,
+    ),
+    ("sample_text", DWRITE_INFORMATIONAL_STRING_SAMPLE_TEXT),
+];
+
+// `INFORMATIONAL_STRINGS` with the names as interned Python strings, so every variant's
+// `information` dict shares the same key objects instead of allocating its own
+type InformationalStringKeys = Vec<(Py<PyString>, DWRITE_INFORMATIONAL_STRING_ID)>;
+static INFORMATIONAL_STRING_KEYS: GILOnceCell<InformationalStringKeys> = GILOnceCell::new();
+
+fn informational_string_keys(py: Python<'_>) -> &'static InformationalStringKeys {
+    INFORMATIONAL_STRING_KEYS.get_or_init(py, || {
+        INFORMATIONAL_STRINGS
+            .iter()
+            .map(|(name, id)| (PyString::intern(py, name).into(), *id))
+            .collect()
+    })
+}
+
+#[pyclass(frozen, module = "windows_fonts", unsendable)]
 struct FontVariant {
     font: IDWriteFont,
     // Keep the family alive so we can use it in `repr`, but don't create a _rust_ memory cycle
     #[pyo3(get)]
     family: Py<FontFamily>,
+    // A read-only `MappingProxyType` over the dict, so the one cached copy can't be modified
+    information: OnceCell<PyObject>,
+    filenames: OnceCell<Vec<Py<PyString>>>,
+    match_key: Cell<Option<MatchKey>>,
 }
 
+// Together these pick out a single font within a family
+type MatchKey = (
+    DWRITE_FONT_WEIGHT,
+    DWRITE_FONT_STRETCH,
+    DWRITE_FONT_STYLE,
+    DWRITE_FONT_SIMULATIONS,
+);
+
 #[pymethods]
 impl FontVariant {
     #[getter]
@@ -377,49 +610,106 @@ impl FontVariant {
     }
 
     #[getter]
-    pub fn filename(&self) -> PyResult<String> {
-        let names = self.files()?;
+    pub fn filename(&self, py: Python<'_>) -> PyResult<Py<PyString>> {
+        let names = self._get_cached_files(py)?;
         if names.len() != 1 {
             Err(PyRuntimeError::new_err(
                 "FontVariant had more than one name, please use .files()",
             ))
         } else {
-            Ok(names[0].to_owned())
+            Ok(names[0].clone_ref(py))
+        }
+    }
+
+    /// The informational strings (copyright, designer, etc.) present in the font, keyed by name
+    #[getter]
+    pub fn information(&self, py: Python<'_>) -> PyResult<PyObject> {
+        if let Some(info) = self.information.get() {
+            return Ok(info.clone_ref(py));
         }
+
+        let info = PyDict::new(py);
+        for (name, id) in informational_string_keys(py) {
+            let mut strings: Option<IDWriteLocalizedStrings> = None;
+            let mut exists = BOOL(0);
+            unsafe {
+                self.font
+                    .GetInformationalStrings(*id, &mut strings, &mut exists)
+                    .map_err(WindowsFontError::from)?;
+            }
+            if let (true, Some(strings)) = (exists.as_bool(), strings) {
+                info.set_item(name, unsafe { strings.get_best_name() }?)?;
+            }
+        }
+        let info: PyObject = py
+            .import("types")?
+            .getattr("MappingProxyType")?
+            .call1((info,))?
+            .into();
+        Ok(self.information.get_or_init(|| info).clone_ref(py))
     }
 
-    pub fn files(&self) -> PyResult<Vec<String>> {
-        let res = unsafe { self._get_files() }?;
-        Ok(res)
+    pub fn files(&self, py: Python<'_>) -> PyResult<Vec<Py<PyString>>> {
+        Ok(self
+            ._get_cached_files(py)?
+            .iter()
+            .map(|name| name.clone_ref(py))
+            .collect())
     }
 
     fn __richcmp__(&self, other: &Self, op: CompareOp, py: Python<'_>) -> PyObject {
         match op {
-            CompareOp::Eq => self.eq(other).into_py(py),
-            CompareOp::Ne => self.ne(other).into_py(py),
+            CompareOp::Eq => self._eq(other, py).into_py(py),
+            CompareOp::Ne => (!self._eq(other, py)).into_py(py),
             _ => py.NotImplemented(),
         }
     }
 }
 
-impl PartialEq for FontVariant {
-    fn eq(&self, other: &Self) -> bool {
-        // Quick checks first
-        if self.weight() != other.weight() || self.style() == other.style() {
-            return false;
+impl FontVariant {
+    fn new(font: IDWriteFont, family: Py<FontFamily>) -> Self {
+        FontVariant {
+            font,
+            family,
+            information: OnceCell::new(),
+            filenames: OnceCell::new(),
+            match_key: Cell::new(None),
         }
+    }
 
-        Python::with_gil(|py| {
-            let family = self.family.as_ref(py);
-            let other_family = other.family.as_ref(py);
+    fn _get_match_key(&self) -> MatchKey {
+        if let Some(key) = self.match_key.get() {
+            return key;
+        }
+        let key = unsafe {
+            (
+                self.font.GetWeight(),
+                self.font.GetStretch(),
+                self.font.GetStyle(),
+                self.font.GetSimulations(),
+            )
+        };
+        self.match_key.set(Some(key));
+        key
+    }
 
-            family.eq(other_family)
-        })
-        .unwrap_or(false)
+    fn _eq(&self, other: &Self, py: Python<'_>) -> bool {
+        self._get_match_key() == other._get_match_key()
+            && *self.family.borrow(py) == *other.family.borrow(py)
+    }
+
+    /// The file paths, resolved through the local font file loader on first use
+    fn _get_cached_files(&self, py: Python<'_>) -> Result<&Vec<Py<PyString>>> {
+        if let Some(files) = self.filenames.get() {
+            return Ok(files);
+        }
+        let files = unsafe { self._get_files() }?
+            .iter()
+            .map(|name| PyString::new(py, name).into())
+            .collect();
+        Ok(self.filenames.get_or_init(|| files))
     }
-}
 
-impl FontVariant {
     unsafe fn _get_files(&self) -> Result<Vec<String>> {
         let face = self.font.CreateFontFace()?;
         let mut num_files = 0u32;
@@ -486,4 +776,16 @@ mod tests {
             /* no-op */
         })
     }
+
+    #[test]
+    fn test_informational_string_names_unique() {
+        // The names become dict keys, so a duplicate would silently hide one of the strings
+        let mut names: Vec<&str> = INFORMATIONAL_STRINGS
+            .iter()
+            .map(|(name, _)| *name)
+            .collect();
+        names.sort_unstable();
+        names.dedup();
+        assert_eq!(names.len(), INFORMATIONAL_STRINGS.len());
+    }
 }
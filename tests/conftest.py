@@ -0,0 +1,13 @@
+import pytest
+
+from windows_fonts import FontCollection
+
+
+@pytest.fixture(scope="session")
+def collection():
+    return FontCollection()
+
+
+@pytest.fixture(scope="session")
+def family(collection: FontCollection):
+    return collection['Arial']
@@ -1,11 +1,10 @@
+import re
+
 import pytest
 
 from windows_fonts import FontCollection
 
-
-@pytest.fixture(scope="module")
-def collection():
-    return FontCollection()
+_UNKNOWN_FAMILY = re.compile(r"unknown font family 'foobarbaznotfound'")
 
 
 def test_len(collection: FontCollection):
@@ -22,6 +21,43 @@ def test_get_index_key_same(collection: FontCollection):
     assert by_idx == by_key
 
 
+def test_family_eq(collection: FontCollection):
+    # Same collection: compared by index
+    assert collection[0] == collection[0]
+    assert collection[0] != collection[1]
+
+    # Different collections: compared by name
+    assert FontCollection()[0] == FontCollection()[0]
+    assert FontCollection()[0] != FontCollection()[1]
+
+
 def test_no_such_font(collection: FontCollection):
-    with pytest.raises(KeyError, match=r"unknown font family 'foobarbaznotfound'"):
+    with pytest.raises(KeyError, match=_UNKNOWN_FAMILY):
+        collection["foobarbaznotfound"]
+
+
+def test_no_such_font_quoted(collection: FontCollection):
+    # The key's repr() is used, so quotes in the name stay unambiguous
+    with pytest.raises(KeyError) as exc:
+        collection["O'Reilly"]
+    assert exc.value.args[0] == 'unknown font family "O\'Reilly"'
+
+
+def test_get_by_name_case_insensitive():
+    # A fresh collection, so both the first lookup (FindFamilyName) and later ones (the name index) are covered
+    collection = FontCollection()
+    assert collection["ARIAL"] == collection["Arial"] == collection["arial"]
+
+    with pytest.raises(KeyError, match=_UNKNOWN_FAMILY):
         collection["foobarbaznotfound"]
+
+
+def test_get_by_other_locale_name():
+    collection = FontCollection()
+    try:
+        gothic = collection["MS Gothic"]
+    except KeyError:
+        pytest.skip("MS Gothic is not installed")
+
+    # The Japanese name is never the "best" name in an English locale, but is still in the index
+    assert collection["ＭＳ ゴシック"] == gothic
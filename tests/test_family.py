@@ -1,16 +1,6 @@
 import pytest
 
-from windows_fonts import FontCollection, FontFamily, Style, Weight
-
-
-@pytest.fixture(scope="module")
-def collection():
-    return FontCollection()
-
-
-@pytest.fixture
-def family(collection: FontCollection):
-    return collection['Arial']
+from windows_fonts import FontFamily, Style, Weight
 
 
 @pytest.mark.parametrize(
@@ -20,6 +10,7 @@ def family(collection: FontCollection):
         pytest.param(700, None, {"weight": Weight.BOLD, "style": Style.NORMAL}, id="700,None"),
         pytest.param(Weight.BOLD, None, {"weight": Weight.BOLD, "style": Style.NORMAL}, id="BOLD,None"),
         pytest.param(Weight.BOLD, Style.ITALIIC, {"weight": Weight.BOLD, "style": Style.ITALIIC}, id="BOLD,True"),
+        pytest.param(700, 2, {"weight": Weight.BOLD, "style": Style.ITALIIC}, id="700,2"),
     ],
 )
 def test_get_best_match(weight, style, expected_props, family: FontFamily):
@@ -29,6 +20,33 @@ def test_get_best_match(weight, style, expected_props, family: FontFamily):
         assert getattr(var, name) == val
 
 
+@pytest.mark.parametrize(
+    ["style", "exc"],
+    [
+        pytest.param(True, TypeError, id="True"),
+        pytest.param(7, ValueError, id="7"),
+        pytest.param(-1, ValueError, id="-1"),
+    ],
+)
+def test_get_best_match_invalid_style(style, exc, family: FontFamily):
+    with pytest.raises(exc):
+        family.get_best_variant(style=style)
+    with pytest.raises(exc):
+        family.get_matching_variants(style=style)
+
+
+def test_get_best_match_defaults_share_cache(family: FontFamily):
+    assert family.get_best_variant() == family.get_best_variant(weight=400, style=Style.NORMAL)
+
+
+def test_get_best_match_agrees_with_matching_variants(family: FontFamily):
+    # get_best_variant asks GetFirstMatchingFont, get_matching_variants ranks with GetMatchingFonts; the winner
+    # should be the same across the whole weight range. Two passes, so cached answers are checked too
+    for _ in range(2):
+        for weight in range(100, 950, 25):
+            assert family.get_best_variant(weight=weight) == family.get_matching_variants(weight=weight)[0]
+
+
 def test_get_matching_variants(family: FontFamily):
     variants = family.get_matching_variants()
     assert isinstance(variants, list)
@@ -1,16 +1,8 @@
-import pytest
-
-from windows_fonts import FontCollection, Style, Weight
-
-
-@pytest.fixture(scope="module")
-def collection():
-    return FontCollection()
+from types import MappingProxyType
 
+import pytest
 
-@pytest.fixture
-def family(collection):
-    return collection['Arial']
+from windows_fonts import Style, Weight
 
 
 @pytest.fixture
@@ -19,7 +11,7 @@ def variant(family):
 
 
 def test_filename(variant):
-    variant.filename.lower().endswith("ARIAL.TTF")
+    assert variant.filename.rpartition("\\")[2].upper() == "ARIAL.TTF"
 
 
 def test_style(variant):
@@ -28,3 +20,22 @@ def test_style(variant):
 
 def test_weight(variant):
     assert isinstance(variant.weight, Weight)
+
+
+def test_eq(family):
+    assert family[0] == family[0]
+    assert family[0] != family.get_best_variant(weight=Weight.BOLD)
+
+
+def test_information(variant):
+    info = variant.information
+    # A read-only view, built once and then re-used
+    assert isinstance(info, MappingProxyType)
+    assert variant.information is info
+
+    k = "copyright"
+    v = info[k]
+    assert k in info and v in info.values()
+
+    with pytest.raises(TypeError):
+        info[k] = "changed"